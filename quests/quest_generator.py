@@ -1,6 +1,8 @@
+from typing import Hashable, List, Tuple
+
 import numpy as np
 import time
-from deap.algorithms import eaSimple
+from deap.algorithms import varAnd
 from deap import tools, base
 from quests.genetic_toolbox import GeneticToolbox
 from quests.individual import Individual
@@ -13,13 +15,16 @@ class QuestGenerator:
 
     def __init__(self, population_size: int, epochs: int, tournament_size: int,
                  crossover_probability: float, mutation_probability: float,
-                 hall_of_fame_size: int = 10):
+                 hall_of_fame_size: int = 10, deduplicate: bool = True,
+                 replace_duplicates: bool = False):
         self.population_size = population_size
         self.epochs = epochs
         self.tournament_size = tournament_size
         self.crossover_probability = crossover_probability
         self.mutation_probability = mutation_probability
         self.hall_of_fame_size = hall_of_fame_size
+        self.deduplicate = deduplicate
+        self.replace_duplicates = replace_duplicates
 
     def _get_stats_logger(self) -> tools.Statistics:
         stats = tools.Statistics(lambda ind: ind.fitness.values)
@@ -35,6 +40,92 @@ class QuestGenerator:
         stats.register("time", get_time_from_start())
         return stats
 
+    def _replace_duplicates(self, world_model: WorldModel, offspring: List[Individual],
+                            keys: List[Hashable]) -> int:
+        """Replaces every clone except the first one with a freshly sampled
+        individual, so the evaluations are spent on new candidates.
+        Keys are updated in place. Returns the number of replaced individuals.
+        """
+
+        seen = set()
+        n_replaced = 0
+        for i, key in enumerate(keys):
+            if key in seen:
+                offspring[i] = world_model.sample_individual()
+                keys[i] = world_model.canonical_key(offspring[i])
+                n_replaced += 1
+            else:
+                seen.add(key)
+        return n_replaced
+
+    def _evaluate(self, toolbox: base.Toolbox, population: List[Individual],
+                  keys: List[Hashable]) -> Tuple[int, int]:
+        """Evaluates individuals with an invalid fitness.
+        Individuals with the same canonical key are evaluated once,
+        the fitness is copied to the remaining ones.
+        Returns the number of evaluations and the number of evaluations saved.
+        """
+
+        invalid = [(ind, key) for ind, key in zip(population, keys) if not ind.fitness.valid]
+        if not self.deduplicate:
+            invalid_ind = [ind for ind, _ in invalid]
+            for ind, fit in zip(invalid_ind, toolbox.map(toolbox.evaluate, invalid_ind)):
+                ind.fitness.values = fit
+            return len(invalid_ind), 0
+
+        known_fitness = {}
+        for ind, key in zip(population, keys):
+            if ind.fitness.valid:
+                known_fitness[key] = ind.fitness.values
+
+        to_evaluate = {}
+        for ind, key in invalid:
+            if key not in known_fitness and key not in to_evaluate:
+                to_evaluate[key] = ind
+
+        fitnesses = toolbox.map(toolbox.evaluate, to_evaluate.values())
+        for key, fit in zip(to_evaluate.keys(), fitnesses):
+            known_fitness[key] = fit
+        for ind, key in invalid:
+            ind.fitness.values = known_fitness[key]
+
+        return len(to_evaluate), len(invalid) - len(to_evaluate)
+
+    def _ea_simple(self, world_model: WorldModel, toolbox: base.Toolbox,
+                   population: List[Individual], stats: tools.Statistics,
+                   hof: tools.HallOfFame, verbose: bool = __debug__) \
+            -> Tuple[List[Individual], tools.Logbook]:
+        """deap.algorithms.eaSimple extended with deduplication of evaluations.
+        Additionally logs the ratio of clones in the population (measured before
+        they are replaced) and the number of evaluations saved.
+        """
+
+        logbook = tools.Logbook()
+        logbook.header = ["gen", "nevals", "duplicates", "saved"] + stats.fields
+
+        def evaluate_and_record(gen: int, individuals: List[Individual]) -> None:
+            keys = [world_model.canonical_key(ind) for ind in individuals]
+            duplicates = 1 - len(set(keys)) / len(individuals)
+            if gen > 0 and self.replace_duplicates:
+                self._replace_duplicates(world_model, individuals, keys)
+            n_evals, n_saved = self._evaluate(toolbox, individuals, keys)
+            hof.update(individuals)
+            population[:] = individuals
+            logbook.record(gen=gen, nevals=n_evals, duplicates=duplicates,
+                           saved=n_saved, **stats.compile(population))
+            if verbose:
+                print(logbook.stream)
+
+        evaluate_and_record(0, list(population))
+
+        for gen in range(1, self.epochs + 1):
+            offspring = toolbox.select(population, len(population))
+            offspring = varAnd(offspring, toolbox, self.crossover_probability,
+                               self.mutation_probability)
+            evaluate_and_record(gen, offspring)
+
+        return population, logbook
+
     def run(self, world_model: WorldModel, genetic_toolbox: GeneticToolbox) -> Individual:
         toolbox = base.Toolbox()
         toolbox.register("mate", genetic_toolbox.crossover)
@@ -52,8 +143,7 @@ class QuestGenerator:
         stats = self._get_stats_logger()
         hof = tools.HallOfFame(self.hall_of_fame_size)
 
-        _, log = eaSimple(population, toolbox, self.crossover_probability,
-                          self.mutation_probability, self.epochs, stats, hof)
+        _, log = self._ea_simple(world_model, toolbox, population, stats, hof)
 
         best_ind = None
         for ind in hof:
@@ -41,6 +41,8 @@ def run(args) -> None:
             "min": [x["min"] for x in log],
             "avg": [x["avg"] for x in log],
             "stddev": [x["stddev"] for x in log],
+            "duplicates": [x["duplicates"] for x in log],
+            "saved": [x["saved"] for x in log],
         })
         save_json(history, config["path"])
 
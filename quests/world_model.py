@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import List, Tuple
+from typing import FrozenSet, List, Tuple
 
 import numpy as np
 
@@ -100,6 +100,17 @@ class WorldModel:
             self._fix_state(individual.final_state)
         )
 
+    def canonical_key(self, individual: Individual) -> Tuple[FrozenSet[Tuple[str, ...]], ...]:
+        """Returns a hashable key identifying an individual regardless of
+        the order of its predicates. States are fixed first, so conflicts
+        are still resolved by ordering before the order is dropped.
+        """
+
+        return (
+            frozenset(self._fix_state(individual.initial_state)),
+            frozenset(self._fix_state(individual.final_state))
+        )
+
     def _run_solver(self, individual: Individual) -> List[Tuple[str, ...]]:
         """Finds a path to the final state of an individual starting from
         the union of the global initial state and individual's initial state.
@@ -0,0 +1,113 @@
+import unittest
+from unittest import mock
+import numpy as np
+from deap import base, tools
+
+from quests.individual import Individual
+from quests.quest_generator import QuestGenerator
+
+
+class QuestGeneratorTest(unittest.TestCase):
+
+    def _get_world_model(self) -> mock.Mock:
+        world_model = mock.Mock()
+        world_model.canonical_key = lambda x: (frozenset(x.initial_state),
+                                               frozenset(x.final_state))
+        world_model.sample_individual = lambda: Individual([('new',)], [('new',)])
+        return world_model
+
+    def _get_keys(self, population):
+        return [self._get_world_model().canonical_key(ind) for ind in population]
+
+    def test_evaluate_deduplicates(self) -> None:
+        qg = QuestGenerator(4, 1, 3, 0.5, 0.5)
+        evaluate = mock.Mock(return_value=[1.0])
+        toolbox = base.Toolbox()
+        toolbox.register("evaluate", evaluate)
+        population = [
+            Individual([('a',), ('b',)], [('c',)]),
+            Individual([('b',), ('a',)], [('c',)]),
+            Individual([('a',)], [('c',)]),
+            Individual([('a',), ('b',)], [('c',)]),
+        ]
+
+        n_evals, n_saved = qg._evaluate(toolbox, population, self._get_keys(population))
+
+        self.assertEqual(n_evals, 2)
+        self.assertEqual(n_saved, 2)
+        self.assertEqual(evaluate.call_count, 2)
+        for ind in population:
+            self.assertEqual(ind.fitness.values, (1.0,))
+
+    def test_evaluate_reuses_valid_fitness(self) -> None:
+        qg = QuestGenerator(3, 1, 3, 0.5, 0.5)
+        evaluate = mock.Mock(return_value=[1.0])
+        toolbox = base.Toolbox()
+        toolbox.register("evaluate", evaluate)
+        population = [
+            Individual([('a',), ('b',)], [('c',)]),
+            Individual([('b',), ('a',)], [('c',)]),
+            Individual([('a',)], [('c',)]),
+        ]
+        population[0].fitness.values = (5.0,)
+
+        n_evals, n_saved = qg._evaluate(toolbox, population, self._get_keys(population))
+
+        self.assertEqual(n_evals, 1)
+        self.assertEqual(n_saved, 1)
+        self.assertEqual(population[1].fitness.values, (5.0,))
+        self.assertEqual(population[2].fitness.values, (1.0,))
+
+    def test_evaluate_without_deduplication(self) -> None:
+        qg = QuestGenerator(3, 1, 3, 0.5, 0.5, deduplicate=False)
+        evaluate = mock.Mock(return_value=[1.0])
+        toolbox = base.Toolbox()
+        toolbox.register("evaluate", evaluate)
+        population = [
+            Individual([('a',), ('b',)], [('c',)]),
+            Individual([('b',), ('a',)], [('c',)]),
+            Individual([('a',), ('b',)], [('c',)]),
+        ]
+
+        n_evals, n_saved = qg._evaluate(toolbox, population, self._get_keys(population))
+
+        self.assertEqual(n_evals, 3)
+        self.assertEqual(n_saved, 0)
+        self.assertEqual(evaluate.call_count, 3)
+
+    def test_replace_duplicates(self) -> None:
+        qg = QuestGenerator(3, 1, 3, 0.5, 0.5, replace_duplicates=True)
+        offspring = [
+            Individual([('a',), ('b',)], [('c',)]),
+            Individual([('b',), ('a',)], [('c',)]),
+            Individual([('a',)], [('c',)]),
+        ]
+        keys = self._get_keys(offspring)
+
+        n_replaced = qg._replace_duplicates(self._get_world_model(), offspring, keys)
+
+        self.assertEqual(n_replaced, 1)
+        self.assertEqual(offspring[1].initial_state, [('new',)])
+        self.assertEqual(keys, self._get_keys(offspring))
+
+    def test_ea_simple(self) -> None:
+        qg = QuestGenerator(4, 2, 3, 0.0, 1.0)
+        toolbox = base.Toolbox()
+        toolbox.register("evaluate", mock.Mock(return_value=[1.0]))
+        toolbox.register("select", lambda population, k: [population[0]] * k)
+        toolbox.register("mutate", lambda x: (Individual(x.initial_state[::-1], x.final_state),))
+        stats = tools.Statistics(lambda ind: ind.fitness.values)
+        stats.register("max", np.max)
+        population = [
+            Individual([('a',), ('b',)], [('c',)]),
+            Individual([('b',), ('a',)], [('c',)]),
+            Individual([('a',)], [('c',)]),
+            Individual([('b',)], [('c',)]),
+        ]
+
+        _, log = qg._ea_simple(self._get_world_model(), toolbox, population, stats,
+                               tools.HallOfFame(1), verbose=False)
+
+        self.assertEqual(log.select("nevals"), [3, 1, 1])
+        self.assertEqual(log.select("saved"), [1, 3, 3])
+        self.assertEqual(log.select("duplicates"), [0.25, 0.75, 0.75])
@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
 
+from quests.individual import Individual
 from quests.pddl_solver import PDDLSolver
 from quests.xml_parser import XmlParser
 from quests.world_model import WorldModel
@@ -16,3 +17,17 @@ class WorldModelTest(unittest.TestCase):
         print("****************")
         print(ind.final_state)
         print(wm.transition_to_state(ind))
+
+    def test_canonical_key(self) -> None:
+        wm = WorldModel(XmlParser("data/geneticquest_db.xml"), PDDLSolver(), 30, 10)
+        a = Individual([('healthy', 'john'), ('at', 'antidote1', 'forest')], [('fed', 'anne')])
+        b = Individual([('at', 'antidote1', 'forest'), ('healthy', 'john')], [('fed', 'anne')])
+        self.assertEqual(wm.canonical_key(a), wm.canonical_key(b))
+
+        a = Individual([('healthy', 'john'), ('infected', 'john')], [('fed', 'anne')])
+        b = Individual([('infected', 'john'), ('healthy', 'john')], [('fed', 'anne')])
+        self.assertNotEqual(wm.canonical_key(a), wm.canonical_key(b))
+
+        a = Individual([('fed', 'anne')], [('at', 'antidote1', 'forest'), ('at', 'antidote1', 'vilage')])
+        b = Individual([('fed', 'anne')], [('at', 'antidote1', 'vilage'), ('at', 'antidote1', 'forest')])
+        self.assertNotEqual(wm.canonical_key(a), wm.canonical_key(b))